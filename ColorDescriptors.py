@@ -29,12 +29,273 @@ Package classes:
 
 ### Import modules
 from math import pi, sqrt, cos, acos, atan, radians, degrees
+from array import array
 import re
 
+### Constants
+# Calculated once here instead of on every color conversion
+_PI_OVER_3     = pi/3
+_TWO_THIRD_PI  = 2/3 * pi
+_FOUR_THIRD_PI = 4/3 * pi
+_TWO_PI        = 2*pi
+_SQRT3         = sqrt(3)
+
+_SEQ_TYPES     = (list, tuple) # accepted containers for multiple colors
+
+### Lookup tables
+# Two character hex strings for every byte value, to avoid formatting on every toString
+_HEX = tuple(f"{i:02x}" for i in range(256))
+_HEX_DIGITS = "0123456789abcdef" # prepended to _HEX for the 12-bit (3 character) hsi values
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF") # characters allowed in a parsed hex string
+
+def _hexByte(val): # f"{val:02x}", using the lookup table when val fits in a byte
+    return _HEX[val] if 0 <= val <= 0xff else f"{val:02x}"
+
+def _hex12(val): # f"{val:03x}", using the lookup tables when val fits in 12 bits
+    return _HEX_DIGITS[val>>8] + _HEX[val&0xff] if 0 <= val <= 0xfff else f"{val:03x}"
+
+def _parseHex(hexStr): # int(hexStr,16), but only for plain hex digits (int() also accepts '_', signs and spaces)
+    if not hexStr or not _HEX_CHARS.issuperset(hexStr):
+        raise ValueError("invalid hex string: '%s'" % hexStr)
+    return int(hexStr,16)
+
+### Color conversions
+# Only compile the conversions with numba when asked to (COLORDESCRIPTORS_JIT=1 in the environment), compiling takes
+# over a second on first use and CircuitPython has neither numba nor os.environ
+try:
+    from os import environ
+    _useJit = environ.get('COLORDESCRIPTORS_JIT') == '1'
+except ImportError:
+    _useJit = False
+
+if _useJit:
+    try:
+        from numba import njit as _jit
+    except ImportError:
+        print('Unable to import numba, using the uncompiled color conversions')
+        _useJit = False
+
+if _useJit:
+    @_jit
+    def _acos(x): # numba's acos returns nan for out of range inputs, raise like math.acos instead
+        if x < -1 or x > 1:
+            raise ValueError("math domain error")
+        return acos(x)
+else:
+    def _jit(func):
+        return func
+    _acos = acos
+
+@_jit
+def _rgbw2hsi(red, green, blue, white):
+    # Seemingly done here in this ColorDescriptors::ColorSolid code for the first time, for all I can tell!
+    # Check for no-white condition
+    if white == 0:
+        return _rgb2hsi(red, green, blue)
+    
+    # Calculate the saturation and intensity
+    saturation = (red + green + blue) / (red + green + blue + white) # based on the amount of white
+    intensity = (red + green + blue + white) / 255 # up to x1.0 for each LED
+    
+    # Check if all the colors are zero
+    if red == 0 and green == 0 and blue == 0:
+        return 0, saturation, intensity # hue doesn't matter!
+        
+    # Check if all-but-one of the colors are zero
+    if red == 0 and green == 0:
+        hue = 240 # in color-wheel degrees, blue
+        return hue, saturation, intensity
+    if green == 0 and blue == 0:
+        hue = 0 # in color-wheel degrees, red
+        return hue, saturation, intensity
+    if blue == 0 and red == 0:
+        hue = 120 # in color-wheel degrees, green
+        return hue, saturation, intensity
+        
+    # Check if just one color is zero (often generated via the hsi2rgbw)
+    if red == 0:
+        hue = 2 * atan((2*sqrt(blue*blue - blue * green + green*green) - 2*green + blue) / (_SQRT3 * blue))
+        hue = hue + _TWO_THIRD_PI
+        hue = hue * 180/pi;
+        return hue, saturation, intensity
+    if green == 0:
+        hue = 2 * atan((2*sqrt(blue*blue - blue * red + red*red) - 2*blue + red) / (_SQRT3 * red))
+        hue = hue + _FOUR_THIRD_PI
+        hue = hue * 180/pi;
+        return hue, saturation, intensity
+    if blue == 0:
+        hue = 2 * atan((2*sqrt(green*green - green * red + red*red) - 2*red + green) / (_SQRT3 * green))
+        hue = hue * 180/pi;
+        return hue, saturation, intensity
+    
+    # If none of the colors are zero, the solution will be similar to the
+    # simple rgb2hsi case, except with modified intensity and saturation
+    
+    # Convert to range 0-1:
+    r = red / 255.0
+    g = green / 255.0
+    b = blue / 255.0
+    
+    hue = _acos((r-g + r-b)/2 * sqrt((r-g)*(r-g) + (r-b)*(g-b)));
+    if blue > green:
+        hue = _TWO_PI - hue; # if b > g, hue = 360 degrees
+    hue = hue * 180/pi;
+    
+    # Calculate saturation
+    intensity = (red + green + blue) / (255 * 3)
+    saturation = 1.0 - min(r, min(g, b))/intensity # rgb saturation
+    saturation = saturation * (255 - white)/255 # scale with white value
+    
+    # Recalculate intensity based on all colors again
+    intensity = (red + green + blue + white) / 255
+    return hue, saturation, intensity
+    
+@_jit
+def _rgb2hsi(red, green, blue):
+    # From: https://github.com/tigoe/ColorConverter/blob/b18d355863483ec61400a2f671136dbccc6ac2ac/src/ColorConverter.cpp
+    # Convert input values to range 0-1:
+    r = red / 255.0
+    g = green / 255.0
+    b = blue / 255.0
+    
+    # find minimum and maximum of the three:
+    minimum = min(r, min(g, b))
+    maximum = max(r, max(g, b))
+    
+    # find intensity:
+    intensity = (r + g + b) / 3.0
+    
+    # find saturation:
+    if intensity == 0:
+        saturation = 0
+    else:
+        saturation = 1.0 - minimum/intensity
+    
+    # find hue:
+    hue = _acos((r-g + r-b)/2 * sqrt((r-g)*(r-g) + (r-b)*(g-b)));
+    # if b > g, hue = 360 degrees - hue:
+    if b > g:
+        hue = _TWO_PI - hue;
+    #  if all colors equal, hue is irrelevant:
+    if minimum == maximum:
+        hue = 0;
+    
+    # convert to degrees
+    hue = hue * 180/pi;
+
+    intensity = (r + g + b)
+    return hue, saturation, intensity
+    
+@_jit
+def _hsi2rgbw(hue, saturation, intensity):
+    # From: http://blog.saikoled.com/post/44677718712/how-to-convert-from-hsi-to-rgb-white
+    hue = hue % 360 # cycle H around to 0-360 degrees
+    hue = pi*hue/180 # Convert to radians.
+    
+    # Clamp S to interval [0,1] and I to interval [0,4] (because RBW can be full 'white' too)
+    saturation = (saturation if saturation<1 else 1) if saturation>0 else 0
+    intensity = (intensity if intensity<4 else 4) if intensity>0 else 0
+
+    if hue < _TWO_THIRD_PI: # First third
+        ratio = cos(hue)/cos(_PI_OVER_3-hue) # same for every channel, only calculate it once
+        r = saturation*intensity/3*(1+   ratio)  * 255
+        g = saturation*intensity/3*(1+(1-ratio)) * 255
+        b = 0
+    elif hue < _FOUR_THIRD_PI: # Second third
+        hue = hue - _TWO_THIRD_PI
+        ratio = cos(hue)/cos(_PI_OVER_3-hue)
+        r = 0
+        g = saturation*intensity/3*(1+   ratio)  * 255
+        b = saturation*intensity/3*(1+(1-ratio)) * 255
+    else: # Third section
+        hue = hue - _FOUR_THIRD_PI
+        ratio = cos(hue)/cos(_PI_OVER_3-hue)
+        r = saturation*intensity/3*(1+(1-ratio)) * 255
+        g = 0
+        b = saturation*intensity/3*(1+   ratio)  * 255
+        
+    w = (1-saturation)*intensity * 255
+    
+    # Clamp rgbw to valid ranges
+    r = (r if r<255 else 255) if r>0 else 0
+    g = (g if g<255 else 255) if g>0 else 0
+    b = (b if b<255 else 255) if b>0 else 0
+    w = (w if w<255 else 255) if w>0 else 0
+    
+    return r, g, b, w
+    
+@_jit
+def _hsi2rgb(hue, saturation, intensity):
+    # From: https://blog.saikoled.com/post/43693602826/why-every-led-light-should-be-using-hsi
+    hue = hue % 360 # cycle H around to 0-360 degrees
+    hue = pi*hue/180 # Convert to radians.
+    
+    # Clamp S to interval [0,1] and I to interval [0,3] (because RBW can be full 'white' too)
+    saturation = (saturation if saturation<1 else 1) if saturation>0 else 0
+    intensity = (intensity if intensity<3 else 3) if intensity>0 else 0
+
+    if hue < _TWO_THIRD_PI: # First third
+        cosHue, cosRest = cos(hue), cos(_PI_OVER_3-hue) # same for every channel, only calculate them once
+        r = saturation*intensity/3*(1+   saturation*cosHue/cosRest)  * 255
+        g = saturation*intensity/3*(1+saturation*(1-cosHue/cosRest)) * 255
+        b = intensity/3 * (1-saturation) * 255
+    elif hue < _FOUR_THIRD_PI: # Second third
+        hue = hue - _TWO_THIRD_PI
+        cosHue, cosRest = cos(hue), cos(_PI_OVER_3-hue)
+        r = intensity/3 * (1-saturation) * 255
+        g = saturation*intensity/3*(1+   saturation*cosHue/cosRest)  * 255
+        b = saturation*intensity/3*(1+saturation*(1-cosHue/cosRest)) * 255
+    else: # Third section
+        hue = hue - _FOUR_THIRD_PI
+        cosHue, cosRest = cos(hue), cos(_PI_OVER_3-hue)
+        r = saturation*intensity/3*(1+saturation*(1-cosHue/cosRest)) * 255
+        g = intensity/3 * (1-saturation) * 255
+        b = saturation*intensity/3*(1+   saturation*cosHue/cosRest)  * 255
+    
+    # Clamp rgb to valid ranges
+    r = (r if r<255 else 255) if r>0 else 0
+    g = (g if g<255 else 255) if g>0 else 0
+    b = (b if b<255 else 255) if b>0 else 0
+    
+    return r, g, b
+
+def _checkJit(): # run the compiled conversions next to the uncompiled ones, True if every result matches
+    rgbValues = (0, 1, 100, 127.5, 255, 510)
+    hsiSamples = [(hue, saturation, intensity) for hue in (-30, 0, 60, 119.9, 120, 240, 300, 359.9, 360, 720)
+                                               for saturation in (-0.5, 0, 0.5, 1, 1.5)
+                                               for intensity in (0, 0.5, 1, 3, 5)]
+    rgbSamples = [(r, g, b) for r in rgbValues for g in rgbValues for b in rgbValues]
+    tests = [(_rgbw2hsi, [rgb + (white,) for rgb in rgbSamples for white in (0, 64, 255)]),
+             (_rgb2hsi,  rgbSamples),
+             (_hsi2rgbw, hsiSamples),
+             (_hsi2rgb,  hsiSamples)]
+    for func, samples in tests:
+        for args in samples:
+            try:
+                expected = func.py_func(*args)
+            except Exception as e:
+                expected = type(e)
+            try:
+                result = func(*args)
+            except Exception as e:
+                result = type(e)
+            if isinstance(expected, type) or isinstance(result, type):
+                if expected is not result:
+                    return False
+            elif any(abs(x - y) > 1e-9 * max(1, abs(x)) for x, y in zip(expected, result)):
+                return False
+    return True
+
+if _useJit and not _checkJit():
+    print('The compiled color conversions do not match the uncompiled ones, using the uncompiled color conversions')
+    _rgbw2hsi, _rgb2hsi, _hsi2rgbw, _hsi2rgb = _rgbw2hsi.py_func, _rgb2hsi.py_func, _hsi2rgbw.py_func, _hsi2rgb.py_func
+    _acos = acos
+
 ### Initialize classes
 # Base color class for object checking
 baseColorPrefix = '_'
 class BaseColor(object):
+    __slots__ = () # let subclasses decide on their own attributes
     prefix = baseColorPrefix
     parsingRegex = re.compile(r'^(.*?)(?:' + baseColorPrefix + r')')
 
@@ -60,6 +321,8 @@ class BaseColor(object):
 
 # Color class to store RGB/W or HIS values and convert from/to a hex string
 class ColorSolid(BaseColor):
+    __slots__ = ('_red', '_green', '_blue', '_white', '_hue', '_saturation', '_intensity', '_enableWhite',
+                 '_inputType', '_strCache', '_rgbDirty', '_hsiDirty') # no per-instance dict, gradients can hold a lot of these
     colorPrefix = '' + BaseColor.prefix
 
     def __init__(self, red=None, green=None, blue=None, white=None, hue=0, saturation=1.0, intensity=1.0, enableWhite=True):
@@ -74,6 +337,9 @@ class ColorSolid(BaseColor):
         self._enableWhite = enableWhite # [bool] is there an additional white LED installed?
 
         self._inputType  = None # configured automatically
+        self._strCache   = None # toString() output, cleared whenever a value changes
+        self._rgbDirty   = False # rgb[w] values need to be converted from hsi before being used
+        self._hsiDirty   = False # hsi values need to be converted from rgb[w] before being used
         
         ### Check what values where input
         # RGB[W] input
@@ -87,11 +353,8 @@ class ColorSolid(BaseColor):
                 self._inputType = 'rgbw'
                 self._white = white
                 
-            # Convert RGB[W] input to HSI
-            if self._enableWhite:
-                self._hue, self._saturation, self._intensity = ColorSolid.rgbw2hsi(red,green,blue,white)
-            else:
-                self._hue, self._saturation, self._intensity = ColorSolid.rgb2hsi(red,green,blue)
+            # Convert RGB[W] input to HSI (only when it's first needed)
+            self._hsiDirty = True
         
         # HSI input
         elif hue is not None and saturation is not None and intensity is not None:
@@ -100,16 +363,16 @@ class ColorSolid(BaseColor):
             self._intensity = intensity
             self._inputType = 'hsi'
             
-            # Convert HSI input to RGB[W]
-            if not self._enableWhite:
-                self._red, self._green, self._blue = ColorSolid.hsi2rgb(hue,saturation,intensity)
-            else:
-                self._red, self._green, self._blue, self._white = ColorSolid.hsi2rgbw(hue,saturation,intensity)
+            # Convert HSI input to RGB[W] (only when it's first needed)
+            self._rgbDirty = True
         
         else:
             print('Must input either rgb[w] or hsi; output object not configured correctly')
             
     def copy(self, forceMode=None): # no copy module in circuitpython, so this'll have to do
+        # A new color would come out exactly the same (white enabled, same input values), so skip rebuilding it
+        if forceMode is None and self._enableWhite is True and ((self._inputType=='hsi' and not self._hsiDirty) or (self._inputType=='rgbw' and not self._rgbDirty)):
+            return self._cloneNoConvert()
         if (forceMode is not None and forceMode=='rgb') or self._inputType=='rgb':
             return type(self)(red=self.red, green=self.green, blue=self.blue)
         elif (forceMode is not None and forceMode=='rgbw') or self._inputType=='rgbw':
@@ -117,61 +380,95 @@ class ColorSolid(BaseColor):
         elif (forceMode is not None and forceMode=='hsi') or self._inputType=='hsi':
             return type(self)(hue=self.hue, saturation=self.saturation, intensity=self.intensity)
 
+    def _cloneNoConvert(self): # copy the stored values over directly, without going through __init__
+        clone = object.__new__(type(self))
+        clone._red, clone._green, clone._blue, clone._white = self._red, self._green, self._blue, self._white
+        clone._hue, clone._saturation, clone._intensity = self._hue, self._saturation, self._intensity
+        clone._enableWhite, clone._inputType, clone._strCache = self._enableWhite, self._inputType, self._strCache
+
+        # Like a brand new color, only the input values are kept and the others are converted again when needed
+        clone._rgbDirty = self._inputType == 'hsi'
+        clone._hsiDirty = self._inputType != 'hsi'
+        return clone
+
     def toString(self, forceMode=None): # "crrggbb[ww]" or "hhhhsssiii[w]" in hex
+        if forceMode is None:
+            if self._strCache is None:
+                self._strCache = self._toString()
+            return self._strCache
+        return self._toString(forceMode)
+
+    def _toString(self, forceMode=None):
         if (forceMode is not None and forceMode=='rgb') or self._inputType=='rgb':
-            return ColorSolid.colorPrefix + "c{:02x}{:02x}{:02x}".format(round(self.red),round(self.green),round(self.blue))
+            return ColorSolid.colorPrefix + "c" + _hexByte(round(self.red)) + _hexByte(round(self.green)) + _hexByte(round(self.blue))
         elif (forceMode is not None and forceMode=='rgbw') or self._inputType=='rgbw':
             white = self.white if self.white is not None else 0
-            return ColorSolid.colorPrefix + "c{:02x}{:02x}{:02x}{:02x}".format(round(self.red),round(self.green),round(self.blue),round(white))
+            return ColorSolid.colorPrefix + "c" + _hexByte(round(self.red)) + _hexByte(round(self.green)) + _hexByte(round(self.blue)) + _hexByte(round(white))
         elif (forceMode is not None and forceMode=='hsi') or self._inputType=='hsi':
             hue = self.hue % 360 if not self.hue == 360 else 360 # allow '360' output, but mod otherwise, allowing for full circle interpolations
+            hsiStr = ColorSolid.colorPrefix + "h" + _hex12(round(hue)) + _hex12(round(self.saturation*255)) + _hex12(round(self.intensity*255))
             if self._enableWhite == True: # add 'w' to the end to indicate this is a white-enabled hsi
-                return ColorSolid.colorPrefix + "h{:03x}{:03x}{:03x}w".format(round(hue),round(self.saturation*255),round(self.intensity*255))
+                return hsiStr + "w"
             else:
-                return ColorSolid.colorPrefix + "h{:03x}{:03x}{:03x}".format(round(hue),round(self.saturation*255),round(self.intensity*255))
+                return hsiStr
     
+    def _updateRgb(self): # convert the current hsi values into rgb[w]
+        self._rgbDirty = False
+        if self._enableWhite:
+            self._red, self._green, self._blue, self._white = ColorSolid.hsi2rgbw(self._hue,self._saturation,self._intensity)
+        else:
+            self._red, self._green, self._blue = ColorSolid.hsi2rgb(self._hue,self._saturation,self._intensity)
+
+    def _updateHsi(self): # convert the current rgb[w] values into hsi
+        self._hsiDirty = False
+        if self._enableWhite:
+            self._hue, self._saturation, self._intensity = ColorSolid.rgbw2hsi(self._red,self._green,self._blue,self._white)
+        else:
+            self._hue, self._saturation, self._intensity = ColorSolid.rgb2hsi(self._red,self._green,self._blue)
+
+    def _syncFromRgb(self): # called before an rgb[w] value changes, hsi is then converted from it when next needed
+        self._strCache = None
+        if self._rgbDirty: self._updateRgb()
+        self._inputType = 'rgbw' if self._enableWhite else 'rgb'
+        self._hsiDirty = True
+
+    def _syncFromHsi(self): # called before an hsi value changes, rgb[w] is then converted from it when next needed
+        self._strCache = None
+        if self._hsiDirty: self._updateHsi()
+        self._inputType = 'hsi'
+        self._rgbDirty = True
+
     @property
     def red(self):
+        if self._rgbDirty: self._updateRgb()
         return self._red
     @red.setter
     def red(self, valIn):
+        self._syncFromRgb()
         self._red = valIn
-        if self._enableWhite:
-            self._inputType = 'rgbw'
-            self._hue, self._saturation, self._intensity = ColorSolid.rgbw2hsi(self.red,self.green,self.blue,self.white)
-        else:
-            self._inputType = 'rgb'
-            self._hue, self._saturation, self._intensity = ColorSolid.rgb2hsi(self.red,self.green,self.blue)
         
     @property
     def green(self):
+        if self._rgbDirty: self._updateRgb()
         return self._green
     @green.setter
     def green(self, valIn):
+        self._syncFromRgb()
         self._green = valIn
-        if self._enableWhite:
-            self._inputType = 'rgbw'
-            self._hue, self._saturation, self._intensity = ColorSolid.rgbw2hsi(self.red,self.green,self.blue,self.white)
-        else:
-            self._inputType = 'rgb'
-            self._hue, self._saturation, self._intensity = ColorSolid.rgb2hsi(self.red,self.green,self.blue)
         
     @property
     def blue(self):
+        if self._rgbDirty: self._updateRgb()
         return self._blue
     @blue.setter
     def blue(self, valIn):
+        self._syncFromRgb()
         self._blue = valIn
-        if self._enableWhite:
-            self._inputType = 'rgbw'
-            self._hue, self._saturation, self._intensity = ColorSolid.rgbw2hsi(self.red,self.green,self.blue,self.white)
-        else:
-            self._inputType = 'rgb'
-            self._hue, self._saturation, self._intensity = ColorSolid.rgb2hsi(self.red,self.green,self.blue)
         
     @property
     def white(self):
         if self._enableWhite == True:
+            if self._rgbDirty: self._updateRgb()
             return self._white
         else:
             return None
@@ -180,63 +477,58 @@ class ColorSolid(BaseColor):
         if self._enableWhite == False and valIn is not None:
             print("Unable to configure white color; enable the white LED first (via obj.enableWhite)")
             return
+        self._syncFromRgb()
         self._white = valIn
-        self._inputType = 'rgbw'
-        self._hue, self._saturation, self._intensity = ColorSolid.rgbw2hsi(self.red,self.green,self.blue,self.white)
+        self._inputType = 'rgbw' # even if the white LED is disabled
         
     @property
     def hue(self):
+        if self._hsiDirty: self._updateHsi()
         return self._hue
     @hue.setter
     def hue(self, valIn):
+        self._syncFromHsi()
         self._hue = valIn
-        self._inputType = 'hsi'
-        if self._enableWhite:
-            self._red, self._green, self._blue, self._white = ColorSolid.hsi2rgbw(self.hue,self.saturation,self.intensity)
-        else:
-            self._red, self._green, self._blue = ColorSolid.hsi2rgb(self.hue,self.saturation,self.intensity)
         
     @property
     def saturation(self):
+        if self._hsiDirty: self._updateHsi()
         return self._saturation
     @saturation.setter
     def saturation(self, valIn):
+        self._syncFromHsi()
         self._saturation = valIn
-        self._inputType = 'hsi'
-        if self._enableWhite:
-            self._red, self._green, self._blue, self._white = ColorSolid.hsi2rgbw(self.hue,self.saturation,self.intensity)
-        else:
-            self._red, self._green, self._blue = ColorSolid.hsi2rgb(self.hue,self.saturation,self.intensity)
         
     @property
     def intensity(self):
+        if self._hsiDirty: self._updateHsi()
         return self._intensity
     @intensity.setter
     def intensity(self, valIn):
+        self._syncFromHsi()
         self._intensity = valIn
-        self._inputType = 'hsi'
-        if self._enableWhite:
-            self._red, self._green, self._blue, self._white = ColorSolid.hsi2rgbw(self.hue,self.saturation,self.intensity)
-        else:
-            self._red, self._green, self._blue = ColorSolid.hsi2rgb(self.hue,self.saturation,self.intensity)
         
     @property
     def enableWhite(self):
         return self._enableWhite
     @enableWhite.setter
     def enableWhite(self, valIn):
+        self._strCache = None
+        # Finish any pending conversions before the white LED changes how they're done
+        if self._rgbDirty: self._updateRgb()
+        if self._hsiDirty: self._updateHsi()
         self._enableWhite = valIn
         
         # Update the colors if the input type has now changed (white removed/added)
         if self._enableWhite == True:
             if self._inputType == 'rgbw' or self._inputType == 'rgb':
                 self._inputType = 'rgbw'
-                self._red, self._green, self._blue, self._white = ColorSolid.hsi2rgbw(self.hue,self.saturation,self.intensity)
+                self._rgbDirty = True
         else:
             if self._inputType == 'rgbw' or self._inputType == 'rgb':
                 self._inputType = 'rgb'
                 self._white = None
-                self._red, self._green, self._blue = ColorSolid.hsi2rgb(self.hue,self.saturation,self.intensity)
+                self._rgbDirty = True
 
     def __repr__(self):
         return self.toString()
@@ -244,6 +536,18 @@ class ColorSolid(BaseColor):
     def __eq__(self, other):
         if not isinstance(other, ColorSolid):
             return NotImplemented # don't attempt to compare against unrelated types
+        if self._inputType != other._inputType:
+            return False # rgb, rgbw, and hsi strings can never match each other
+
+        # Identical values always give identical strings, so skip making the strings if they're not already cached
+        if self._strCache is None or other._strCache is None:
+            if self._inputType == 'hsi':
+                if (self.hue, self.saturation, self.intensity, self._enableWhite == True) == (other.hue, other.saturation, other.intensity, other._enableWhite == True):
+                    return True
+            elif (self.red, self.green, self.blue, self.white) == (other.red, other.green, other.blue, other.white):
+                return True
+
+        # Different values can still round to the same string
         return self.toString() == other.toString()
         
     @staticmethod
@@ -258,207 +562,55 @@ class ColorSolid(BaseColor):
             if not (len(strIn) == 6+1 or len(strIn) == 8+1):
                 print('Invalid input length, rgb[w] must be 6 or 8 characters')
                 return None
-            # Split string, convert to int, and return a new object
-            splitStr = [int(strIn[i:i+2],16) for i in range(1, len(strIn), 2)]
-            if len(splitStr) == 3:
-                return ColorSolid(*splitStr, enableWhite=False)
-            elif len(splitStr) == 4:
-                return ColorSolid(*splitStr)
+            # Convert the whole string to an int once, split out the bytes, and return a new object
+            payload = _parseHex(strIn[1:])
+            if len(strIn) == 6+1:
+                return ColorSolid(payload>>16 & 0xff, payload>>8 & 0xff, payload & 0xff, enableWhite=False)
+            else:
+                return ColorSolid(payload>>24 & 0xff, payload>>16 & 0xff, payload>>8 & 0xff, payload & 0xff)
         elif strIn.lower().startswith('h') and strIn.lower().endswith('w'): # HSI with white LED enabled
             if not len(strIn) == 10+1:
                 print('Invalid input length, hsi[w] must be 9 characters')
                 return None
-            strIn = strIn[0:-1] # remove the last 'w'
-            # Split string, convert to int, and return a new object
-            splitStr = [int(strIn[i:i+3],16) for i in range(1, len(strIn), 3)]
-            return ColorSolid(hue=splitStr[0], saturation=splitStr[1]/255, intensity=splitStr[2]/255, enableWhite=True)
+            # Convert the whole string (minus the last 'w') to an int once, split out the 12-bit values, and return a new object
+            payload = _parseHex(strIn[1:-1])
+            return ColorSolid(hue=payload>>24 & 0xfff, saturation=(payload>>12 & 0xfff)/255, intensity=(payload & 0xfff)/255, enableWhite=True)
         elif strIn.lower().startswith('h') and not strIn.lower().endswith('w'): # HSI with the white LED disabled
             # Check for valid input
             if not len(strIn) == 9+1:
                 print('Invalid input length, hsi must be 9 characters')
                 return None
-            # Split string, convert to int, and return a new object
-            splitStr = [int(strIn[i:i+3],16) for i in range(1, len(strIn), 3)]
-            return ColorSolid(hue=splitStr[0], saturation=splitStr[1]/255, intensity=splitStr[2]/255, enableWhite=False)
+            # Convert the whole string to an int once, split out the 12-bit values, and return a new object
+            payload = _parseHex(strIn[1:])
+            return ColorSolid(hue=payload>>24 & 0xfff, saturation=(payload>>12 & 0xfff)/255, intensity=(payload & 0xfff)/255, enableWhite=False)
         else:  
             print('Unable to parse input string ''%s''' % strIn)
             return None
         
     @staticmethod
     def rgbw2hsi(red, green, blue, white):
-        # Seemingly done here in this ColorDescriptors::ColorSolid code for the first time, for all I can tell!
-        # Convert all input none's to zeros
+        # Convert all input none's to zeros (before handing off to the compiled conversion)
         if red is None: red = 0
         if green is None: green = 0
         if blue is None: blue = 0
         if white is None: white = 0
-        
-        # Check for no-white condition
-        if white == 0:
-            return ColorSolid.rgb2hsi(red, green, blue)
-        
-        # Calculate the saturation and intensity
-        saturation = (red + green + blue) / (red + green + blue + white) # based on the amount of white
-        intensity = (red + green + blue + white) / 255 # up to x1.0 for each LED
-        
-        # Check if all the colors are zero
-        if red == 0 and green == 0 and blue == 0:
-            return 0, saturation, intensity # hue doesn't matter!
-            
-        # Check if all-but-one of the colors are zero
-        if red == 0 and green == 0:
-            hue = 240 # in color-wheel degrees, blue
-            return hue, saturation, intensity
-        if green == 0 and blue == 0:
-            hue = 0 # in color-wheel degrees, red
-            return hue, saturation, intensity
-        if blue == 0 and red == 0:
-            hue = 120 # in color-wheel degrees, green
-            return hue, saturation, intensity
-            
-        # Check if just one color is zero (often generated via the hsi2rgbw)
-        if red == 0:
-            hue = 2 * atan((2*sqrt(pow(blue,2) - blue * green + pow(green,2)) - 2*green + blue) / (sqrt(3) * blue))
-            hue = hue + (2/3 * pi)
-            hue = hue * 180/pi;
-            return hue, saturation, intensity
-        if green == 0:
-            hue = 2 * atan((2*sqrt(pow(blue,2) - blue * red + pow(red,2)) - 2*blue + red) / (sqrt(3) * red))
-            hue = hue + (4/3 * pi)
-            hue = hue * 180/pi;
-            return hue, saturation, intensity
-        if blue == 0:
-            hue = 2 * atan((2*sqrt(pow(green,2) - green * red + pow(red,2)) - 2*red + green) / (sqrt(3) * green))
-            hue = hue * 180/pi;
-            return hue, saturation, intensity
-        
-        # If none of the colors are zero, the solution will be similar to the
-        # simple rgb2hsi case, except with modified intensity and saturation
-        
-        # Convert to range 0-1:
-        r = red / 255.0
-        g = green / 255.0
-        b = blue / 255.0
-        
-        hue = acos((r-g + r-b)/2 * sqrt((r-g)*(r-g) + (r-b)*(g-b)));
-        if blue > green:
-            hue = 2*pi - hue; # if b > g, hue = 360 degrees
-        hue = hue * 180/pi;
-        
-        # Calculate saturation
-        intensity = (red + green + blue) / (255 * 3)
-        saturation = 1.0 - min(r, min(g, b))/intensity # rgb saturation
-        saturation = saturation * (255 - white)/255 # scale with white value
-        
-        # Recalculate intensity based on all colors again
-        intensity = (red + green + blue + white) / 255
-        return hue, saturation, intensity
+        return _rgbw2hsi(red, green, blue, white)
         
     @staticmethod
     def rgb2hsi(red, green, blue):
-        # From: https://github.com/tigoe/ColorConverter/blob/b18d355863483ec61400a2f671136dbccc6ac2ac/src/ColorConverter.cpp
-        # Convert input values to range 0-1:
-        r = red / 255.0
-        g = green / 255.0
-        b = blue / 255.0
-        
-        # find minimum and maximum of the three:
-        minimum = min(r, min(g, b))
-        maximum = max(r, max(g, b))
-        
-        # find intensity:
-        intensity = (r + g + b) / 3.0
-        
-        # find saturation:
-        if intensity == 0:
-            saturation = 0
-        else:
-            saturation = 1.0 - minimum/intensity
-        
-        # find hue:
-        hue = acos((r-g + r-b)/2 * sqrt((r-g)*(r-g) + (r-b)*(g-b)));
-        # if b > g, hue = 360 degrees - hue:
-        if b > g:
-            hue = 2*pi - hue;
-        #  if all colors equal, hue is irrelevant:
-        if minimum == maximum:
-            hue = 0;
-        
-        # convert to degrees
-        hue = hue * 180/pi;
-
-        intensity = (r + g + b)
-        return hue, saturation, intensity
+        return _rgb2hsi(red, green, blue)
         
     @staticmethod
     def hsi2rgbw(hue, saturation, intensity):
-        # From: http://blog.saikoled.com/post/44677718712/how-to-convert-from-hsi-to-rgb-white
-        hue = hue % 360 # cycle H around to 0-360 degrees
-        hue = pi*hue/180 # Convert to radians.
-        
-        # Clamp S to interval [0,1] and I to interval [0,4] (because RBW can be full 'white' too)
-        saturation = (saturation if saturation<1 else 1) if saturation>0 else 0
-        intensity = (intensity if intensity<4 else 4) if intensity>0 else 0
-
-        if hue < (2/3 * pi): # First third
-            r = saturation*intensity/3*(1+   cos(hue)/cos((pi/3)-hue))  * 255
-            g = saturation*intensity/3*(1+(1-cos(hue)/cos((pi/3)-hue))) * 255
-            b = 0
-        elif hue < (4/3 * pi): # Second third
-            hue = hue - (2/3 * pi)
-            r = 0
-            g = saturation*intensity/3*(1+   cos(hue)/cos((pi/3)-hue))  * 255
-            b = saturation*intensity/3*(1+(1-cos(hue)/cos((pi/3)-hue))) * 255
-        else: # Third section
-            hue = hue - (4/3 * pi)
-            r = saturation*intensity/3*(1+(1-cos(hue)/cos((pi/3)-hue))) * 255
-            g = 0
-            b = saturation*intensity/3*(1+   cos(hue)/cos((pi/3)-hue))  * 255
-            
-        w = (1-saturation)*intensity * 255
-        
-        # Clamp rgbw to valid ranges
-        r = (r if r<255 else 255) if r>0 else 0
-        g = (g if g<255 else 255) if g>0 else 0
-        b = (b if b<255 else 255) if b>0 else 0
-        w = (w if w<255 else 255) if w>0 else 0
-        
-        return r, g, b, w
+        return _hsi2rgbw(hue, saturation, intensity)
         
     @staticmethod
     def hsi2rgb(hue, saturation, intensity):
-        # From: https://blog.saikoled.com/post/43693602826/why-every-led-light-should-be-using-hsi
-        hue = hue % 360 # cycle H around to 0-360 degrees
-        hue = pi*hue/180 # Convert to radians.
-        
-        # Clamp S to interval [0,1] and I to interval [0,3] (because RBW can be full 'white' too)
-        saturation = (saturation if saturation<1 else 1) if saturation>0 else 0
-        intensity = (intensity if intensity<3 else 3) if intensity>0 else 0
-
-        if hue < (2/3 * pi): # First third
-            r = saturation*intensity/3*(1+   saturation*cos(hue)/cos((pi/3)-hue))  * 255
-            g = saturation*intensity/3*(1+saturation*(1-cos(hue)/cos((pi/3)-hue))) * 255
-            b = intensity/3 * (1-saturation) * 255
-        elif hue < (4/3 * pi): # Second third
-            hue = hue - (2/3 * pi)
-            r = intensity/3 * (1-saturation) * 255
-            g = saturation*intensity/3*(1+   saturation*cos(hue)/cos((pi/3)-hue))  * 255
-            b = saturation*intensity/3*(1+saturation*(1-cos(hue)/cos((pi/3)-hue))) * 255
-        else: # Third section
-            hue = hue - (4/3 * pi)
-            r = saturation*intensity/3*(1+saturation*(1-cos(hue)/cos((pi/3)-hue))) * 255
-            g = intensity/3 * (1-saturation) * 255
-            b = saturation*intensity/3*(1+   saturation*cos(hue)/cos((pi/3)-hue))  * 255
-        
-        # Clamp rgb to valid ranges
-        r = (r if r<255 else 255) if r>0 else 0
-        g = (g if g<255 else 255) if g>0 else 0
-        b = (b if b<255 else 255) if b>0 else 0
-        
-        return r, g, b
+        return _hsi2rgb(hue, saturation, intensity)
 
 # Color gradients
 class ColorGradient(BaseColor):
+    __slots__ = ('_nodes', '_steps', 'interpMode', 'gradient')
     colorPrefix = 'gr' + BaseColor.prefix
 
     def __init__(self, nodes=None, steps=0, interpMode='hsi'):
@@ -478,8 +630,12 @@ class ColorGradient(BaseColor):
         
     @nodes.setter
     def nodes(self, valIn):
-        # Check for valid input node type (needs to be ColorSolid(BaseColor))
-        if valIn is not None and (((not isinstance(valIn,list) and not isinstance(valIn,tuple)) and not isinstance(valIn,ColorSolid)) or ((isinstance(valIn,list) or isinstance(valIn,tuple)) and not all(isinstance(x,ColorSolid) for x in valIn))):
+        # Check for valid input node type (needs to be ColorSolid(BaseColor), or a list/tuple of them)
+        if isinstance(valIn,_SEQ_TYPES):
+            isValid = all(isinstance(x,ColorSolid) for x in valIn)
+        else:
+            isValid = valIn is None or isinstance(valIn,ColorSolid)
+        if not isValid:
             print('Invalid nodes input, needs to be of class ColorSolid')
             return
         self._nodes = valIn
@@ -494,6 +650,17 @@ class ColorGradient(BaseColor):
         if self.nodes is None:
             return ""
         return ColorGradient.colorPrefix + (",".join([x.toString() for x in self.nodes]) + ";" + str(self.steps))
+
+    def writeTo(self, buf): # write the same output as toString() into a buffer (e.g. io.StringIO), one color at a time
+        if self.nodes is None:
+            return
+        buf.write(ColorGradient.colorPrefix)
+        separator = ""
+        for x in self.nodes:
+            buf.write(separator)
+            buf.write(x.toString())
+            separator = ","
+        buf.write(";" + str(self.steps))
         
     def __repr__(self):
         return self.toString()
@@ -503,6 +670,36 @@ class ColorGradient(BaseColor):
             return NotImplemented # don't attempt to compare against unrelated types
         return self.toString() == other.toString()
     
+    def toBytes(self): # "r0g0b0[w0]r1g1b1[w1]..." as bytes, ready to be written out to the LEDs
+        channels = [channel for channel in self.toArrays() if channel is not None]
+        return bytes(val for color in zip(*channels) for val in color)
+
+    def toArrays(self): # gradient colors split into separate (red, green, blue, white) byte arrays
+        # Always built from the current colors, the nodes (and so the gradient) can be changed in place
+        gradient = self.gradient
+        if gradient is None:
+            gradient = []
+        elif isinstance(gradient,ColorSolid):
+            gradient = [gradient]
+
+        # Only keep the white channel if there are any enabled white LEDs in the nodes
+        includeWhite = _anyWhiteEnabled(self.nodes)
+        values = [_colorBytes(color, includeWhite) for color in gradient]
+
+        return (array('B', [val[0] for val in values]),
+                array('B', [val[1] for val in values]),
+                array('B', [val[2] for val in values]),
+                array('B', [val[3] for val in values]) if includeWhite else None)
+
+    def generateBytes(self): # same output as toBytes(), but without creating a ColorSolid for each step
+        if self.interpMode not in ('hsi','rgbw'):
+            return None # same as generate()
+        if self.steps == 0 or self.nodes is None or isinstance(self.nodes,ColorSolid):
+            return self.toBytes() # nothing to interpolate, the gradient is just the nodes
+        if self.interpMode == 'hsi':
+            return linearInterpHsiBytes(self.nodes, self.steps)
+        return linearInterpRgbwBytes(self.nodes, self.steps)
+
     def generate(self):
         if self.interpMode == 'hsi':
             return linearInterpHsi(self.nodes, self.steps)
@@ -675,35 +872,24 @@ def linearInterpHsi(nodes, steps, interpIntensity=False):
     # Check if the output is invalid (none or a single color)
     if nodes is None:
         return None
-    elif (not isinstance(nodes,list) and not isinstance(nodes,tuple)) and isinstance(nodes,ColorSolid):
+    elif isinstance(nodes,ColorSolid):
         return nodes # return the one and only color
     elif steps == 0:
         return nodes # just return the list of colors, if no steps were requested
     
     # Check if there any enable white LEDs in the node list
-    whiteEnabled = any([color.enableWhite for color in nodes])
+    whiteEnabled = any(color.enableWhite for color in nodes)
 
-    # Loop over each sequential pair of colors
-    steps = steps + 1
+    # Generate the new colors for each sequential pair of colors
     outputList = []
-    for curColor, nextColor in zip(nodes, nodes[1:]):
-        # Calculate steps between the current and next color
-        for idx in range(1,steps+1):
-            curPos = (idx-1.0)/steps # effective percent
-            newTheta = lerp(curPos,0.0,1.0,curColor.hue,nextColor.hue)
-            newSat   = lerp(curPos,0.0,1.0,curColor.saturation,nextColor.saturation)
-            newRho   = lerp(curPos,0.0,1.0,curColor.intensity,nextColor.intensity)
-            
-            # Generate new color
-            intermediateColor = ColorSolid(
-                hue         = newTheta,
-                saturation  = newSat,
-                intensity   = newRho,
-                enableWhite = whiteEnabled
-            )
-
-            # Add color to the list
-            outputList.append(intermediateColor)
+    for stepValues, isSame in _interpHsiSegments(nodes, steps):
+        if isSame: # nothing changes between two identical colors, so build one color and clone it for every step
+            newTheta, newSat, newRho = stepValues[0]
+            stepColor = ColorSolid(hue=newTheta, saturation=newSat, intensity=newRho, enableWhite=whiteEnabled)
+            outputList.extend(stepColor._cloneNoConvert() for _ in stepValues)
+        else:
+            outputList.extend([ColorSolid(hue=newTheta, saturation=newSat, intensity=newRho, enableWhite=whiteEnabled)
+                               for newTheta, newSat, newRho in stepValues])
             
     # From my https://github.com/nm3210/ArudinoRgbController/blob/master/ArudinoRgbController/ArudinoRgbController.cpp
     # # Loop over each sequential pair of colors
@@ -758,9 +944,7 @@ def linearInterpHsi(nodes, steps, interpIntensity=False):
     #         # Add color to the list
     #         outputList.append(intermediateColor)
         
-    lastColor = (nodes[-1].copy()) # dereference input color
-    lastColor._inputType = 'hsi'
-    outputList.append(lastColor) # add the last node
+    outputList.append(_lastNodeCopy(nodes, 'hsi')) # add the last node
 
     return outputList
 
@@ -768,50 +952,135 @@ def linearInterpRgbw(nodes, steps):
     # Check if the output is invalid (none or a single color)
     if nodes is None:
         return None
-    elif (not isinstance(nodes,list) and not isinstance(nodes,tuple)) and isinstance(nodes,ColorSolid):
+    elif isinstance(nodes,ColorSolid):
         return nodes # return the one and only color
     elif steps == 0:
         return nodes # just return the list of colors, if no steps were requested
     
     # Check if there any enable white LEDs in the node list
-    whiteEnabled = any([color.enableWhite for color in nodes])
+    whiteEnabled = any(color.enableWhite for color in nodes)
     
-    # Loop over each sequential pair of colors
+    # Generate the new colors for each sequential pair of colors
     outputList = []
-    for curColor, nextColor in zip(nodes, nodes[1:]):
+    for curColor, stepValues, isSame in _interpRgbwSegments(nodes, steps):
         # Add the initial color
         outputList.append(curColor)
-        
-        # Calculate steps between the current and next color
-        for idx in range(steps):
-            curPos = (idx+1) / (steps+1) # effective percent
-            intermediateColorR = round(lerp(curPos,0.0,1.0,curColor.red,nextColor.red))
-            intermediateColorG = round(lerp(curPos,0.0,1.0,curColor.green,nextColor.green))
-            intermediateColorB = round(lerp(curPos,0.0,1.0,curColor.blue,nextColor.blue))
-            
-            # Figure out the white
-            if curColor.white is None and nextColor.white is not None:
-                intermediateColorW = round(lerp(curPos,0.0,1.0,0,nextColor.white))
-            elif curColor.white is not None and nextColor.white is None:
-                intermediateColorW = round(lerp(curPos,0.0,1.0,curColor.white,0))
-            elif curColor.white is not None and nextColor.white is not None:
-                intermediateColorW = round(lerp(curPos,0.0,1.0,curColor.white,nextColor.white))
-            else:
-                intermediateColorW = None
-                
-            # Create the new color
-            intermediateColor = ColorSolid(
-                red   = intermediateColorR,
-                green = intermediateColorG,
-                blue  = intermediateColorB,
-                white = intermediateColorW,
-                enableWhite = whiteEnabled)
-            
-            # Add color to the list
-            outputList.append(intermediateColor)
-        
-    lastColor = (nodes[-1].copy()) # dereference input color
-    lastColor._inputType = 'rgbw'
-    outputList.append(lastColor) # add the last node
 
-    return outputList
\ No newline at end of file
+        if isSame: # nothing changes between two identical colors, so build one color and clone it for every step
+            r, g, b, w = stepValues[0]
+            stepColor = ColorSolid(red=r, green=g, blue=b, white=w, enableWhite=whiteEnabled)
+            outputList.extend(stepColor._cloneNoConvert() for _ in stepValues)
+        else:
+            outputList.extend([ColorSolid(red=r, green=g, blue=b, white=w, enableWhite=whiteEnabled)
+                               for r, g, b, w in stepValues])
+
+    outputList.append(_lastNodeCopy(nodes, 'rgbw')) # add the last node
+
+    return outputList
+
+def _interpHsiSegments(nodes, steps):
+    # Yields the (hue, saturation, intensity) of every step between each sequential pair of colors (starting with the
+    # first color of the pair), along with whether the two colors are identical
+    hsiNodes = [(color.hue, color.saturation, color.intensity) for color in nodes]
+
+    # The effective percent of each step is the same for every pair of colors
+    steps = steps + 1
+    positions = [(idx-1.0)/steps for idx in range(1,steps+1)]
+
+    for curHsi, nextHsi in zip(hsiNodes, hsiNodes[1:]):
+        if curHsi == nextHsi:
+            yield [curHsi] * steps, True
+            continue
+
+        (curHue,curSat,curInt), (nextHue,nextSat,nextInt) = curHsi, nextHsi
+        dHue, dSat, dInt = nextHue-curHue, nextSat-curSat, nextInt-curInt
+        yield [(curHue + dHue*curPos, curSat + dSat*curPos, curInt + dInt*curPos) for curPos in positions], False
+
+def _interpRgbwSegments(nodes, steps):
+    # Yields the first color of each sequential pair of colors, the rounded (red, green, blue, white) of every step
+    # between them, and whether the two colors are identical
+    rgbwNodes = [(color.red, color.green, color.blue, color.white) for color in nodes]
+
+    # The effective percent of each step is the same for every pair of colors
+    positions = [(idx+1) / (steps+1) for idx in range(steps)]
+
+    for curColor, (curR,curG,curB,curW), (nextR,nextG,nextB,nextW) in zip(nodes, rgbwNodes, rgbwNodes[1:]):
+        # Figure out the white, only leave it empty if neither color has one
+        hasWhite = curW is not None or nextW is not None
+        curW  = curW  if curW  is not None else 0
+        nextW = nextW if nextW is not None else 0
+
+        if (curR,curG,curB,curW) == (nextR,nextG,nextB,nextW):
+            yield curColor, [(round(curR), round(curG), round(curB), round(curW) if hasWhite else None)] * steps, True
+            continue
+
+        # The positions are already within 0-1, so this is just lerp without the clamping
+        dR, dG, dB, dW = nextR-curR, nextG-curG, nextB-curB, nextW-curW
+        yield curColor, [(round(curR + dR*curPos),
+                          round(curG + dG*curPos),
+                          round(curB + dB*curPos),
+                          round(curW + dW*curPos) if hasWhite else None) for curPos in positions], False
+
+def _lastNodeCopy(nodes, inputType): # copy of the last node, to finish off an interpolated gradient
+    lastColor = nodes[-1].copy() # dereference input color
+    lastColor._inputType = inputType
+    lastColor._strCache = None # the cached string may have been for a different input type
+    return lastColor
+
+def _anyWhiteEnabled(nodes): # check if there are any enabled white LEDs in the node(s)
+    if nodes is None:
+        return False
+    elif isinstance(nodes,ColorSolid):
+        return nodes.enableWhite
+    return any(color.enableWhite for color in nodes)
+
+def _ledByte(val): # round a color value to a single LED byte, clamped to 0-255 (colors themselves aren't limited)
+    val = round(val)
+    return (val if val<255 else 255) if val>0 else 0
+
+def _colorBytes(color, includeWhite): # rgb[w] values of a color, in the same form as ColorGradient.toBytes()
+    if not includeWhite and color.enableWhite and color._inputType == 'hsi':
+        # Part of a white-enabled hsi color goes to the white LED (e.g. the last node of an interpolation, which copy()
+        # always makes white-enabled), so convert it like the rest of the rgb-only steps instead
+        return tuple(_ledByte(val) for val in ColorSolid.hsi2rgb(color.hue, color.saturation, color.intensity))
+    if includeWhite:
+        return (_ledByte(color.red), _ledByte(color.green), _ledByte(color.blue), _ledByte(color.white) if color.white is not None else 0)
+    return (_ledByte(color.red), _ledByte(color.green), _ledByte(color.blue))
+
+def linearInterpHsiBytes(nodes, steps):
+    # Same as linearInterpHsi, except the steps are converted straight to rgb[w] bytes instead of new colors
+    whiteEnabled = any(color.enableWhite for color in nodes)
+    hsi2rgbx = ColorSolid.hsi2rgbw if whiteEnabled else ColorSolid.hsi2rgb
+
+    outputBytes = bytearray()
+    for stepValues, isSame in _interpHsiSegments(nodes, steps):
+        if isSame: # nothing changes between two identical colors, so every step is the same bytes
+            outputBytes.extend(bytes(_ledByte(val) for val in hsi2rgbx(*stepValues[0])) * len(stepValues))
+            continue
+        for hue, sat, inten in stepValues:
+            outputBytes.extend(_ledByte(val) for val in hsi2rgbx(hue, sat, inten))
+
+    outputBytes.extend(_colorBytes(_lastNodeCopy(nodes, 'hsi'), whiteEnabled)) # add the last node
+
+    return bytes(outputBytes)
+
+def linearInterpRgbwBytes(nodes, steps):
+    # Same as linearInterpRgbw, except the steps are written straight to rgb[w] bytes instead of new colors
+    whiteEnabled = any(color.enableWhite for color in nodes)
+
+    outputBytes = bytearray()
+    for curColor, stepValues, isSame in _interpRgbwSegments(nodes, steps):
+        # Add the initial color
+        outputBytes.extend(_colorBytes(curColor, whiteEnabled))
+
+        # The steps are between the node values, which can be outside of 0-255
+        if whiteEnabled:
+            stepBytes = [(r, g, b, w if w is not None else 0) for r, g, b, w in stepValues]
+        else:
+            stepBytes = [(r, g, b) for r, g, b, _ in stepValues]
+        for values in stepBytes:
+            outputBytes.extend(_ledByte(val) for val in values)
+
+    outputBytes.extend(_colorBytes(_lastNodeCopy(nodes, 'rgbw'), whiteEnabled)) # add the last node
+
+    return bytes(outputBytes)